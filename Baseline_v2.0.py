@@ -15,6 +15,9 @@ from enum import Enum, auto
 from dataclasses import dataclass
 import time
 
+# Report section rule
+_HRULE = "=" * 70
+
 # LEGACY COMPONENT: Configuration from simulation baseline
 @dataclass
 class GearConfiguration:
@@ -104,20 +107,21 @@ class LandingGearController:
         return True
 
 # Demonstration
-print("="*70)
-print("BAE Systems Landing Gear - Baseline v2.0 (Week 6 Complete)")
-print("="*70)
-print()
+if __name__ == "__main__":
+    print(_HRULE)
+    print("BAE Systems Landing Gear - Baseline v2.0 (Week 6 Complete)")
+    print(_HRULE)
+    print()
 
-controller = LandingGearController(BASELINE_CONFIG)
-success = controller.command_gear_down()
+    controller = LandingGearController(BASELINE_CONFIG)
+    success = controller.command_gear_down()
 
-print()
-print("--- Verification Summary ---")
-print(f"Deployment Time: {controller.deployment_time_ms}ms ({controller.deployment_time_ms/1000:.2f}s)")
-print(f"Requirement: {BASELINE_CONFIG.requirement_time_ms}ms ({BASELINE_CONFIG.requirement_time_ms/1000:.1f}s)")
-if success:
-    print("PASS: Within requirement")
-else:
-    print("FAIL: Exceeds requirement")
-print()
+    print()
+    print("--- Verification Summary ---")
+    print(f"Deployment Time: {controller.deployment_time_ms}ms ({controller.deployment_time_ms/1000:.2f}s)")
+    print(f"Requirement: {BASELINE_CONFIG.requirement_time_ms}ms ({BASELINE_CONFIG.requirement_time_ms/1000:.1f}s)")
+    if success:
+        print("PASS: Within requirement")
+    else:
+        print("FAIL: Exceeds requirement")
+    print()
@@ -21,6 +21,9 @@ from enum import Enum, auto
 from dataclasses import dataclass
 import time
 
+# Report section rule
+_HRULE = "=" * 70
+
 # LEGACY COMPONENT: Configuration from simulation baseline
 @dataclass
 class GearConfiguration:
@@ -141,35 +144,36 @@ class LandingGearController:
         return True
 
 # QA Improvement Demonstration
-print("="*70)
-print("BAE Systems Landing Gear - Baseline v3.0  QA Improvement)")
-print("Real-Time Monitoring Implementation")
-print("="*70)
-print()
-
-controller = LandingGearController(BASELINE_CONFIG)
-success = controller.command_gear_down()
+if __name__ == "__main__":
+    print(_HRULE)
+    print("BAE Systems Landing Gear - Baseline v3.0  QA Improvement)")
+    print("Real-Time Monitoring Implementation")
+    print(_HRULE)
+    print()
 
-print()
-print("="*70)
-print("VERIFICATION REPORT")
-print("="*70)
-print(f"Final State: {controller.state.name}")
-print(f"Deployment Time: {controller.deployment_time_ms}ms ({controller.deployment_time_ms/1000:.2f}s)")
-print(f"Requirement: {BASELINE_CONFIG.requirement_time_ms}ms ({BASELINE_CONFIG.requirement_time_ms/1000:.1f}s)")
+    controller = LandingGearController(BASELINE_CONFIG)
+    success = controller.command_gear_down()
 
-if success and not controller.fault_detected:
-    margin = BASELINE_CONFIG.requirement_time_ms - controller.deployment_time_ms
-    print(f"Margin: {margin}ms")
     print()
-    print("DEPLOYMENT SUCCESSFUL")
-    print("   - All phases completed within requirement")
-    print("   - Continuous monitoring confirmed compliance")
-    print("   - No faults detected")
-else:
+    print(_HRULE)
+    print("VERIFICATION REPORT")
+    print(_HRULE)
+    print(f"Final State: {controller.state.name}")
+    print(f"Deployment Time: {controller.deployment_time_ms}ms ({controller.deployment_time_ms/1000:.2f}s)")
+    print(f"Requirement: {BASELINE_CONFIG.requirement_time_ms}ms ({BASELINE_CONFIG.requirement_time_ms/1000:.1f}s)")
+
+    if success and not controller.fault_detected:
+        margin = BASELINE_CONFIG.requirement_time_ms - controller.deployment_time_ms
+        print(f"Margin: {margin}ms")
+        print()
+        print("DEPLOYMENT SUCCESSFUL")
+        print("   - All phases completed within requirement")
+        print("   - Continuous monitoring confirmed compliance")
+        print("   - No faults detected")
+    else:
+        print()
+        print("DEPLOYMENT FAILED")
+        print("   - Requirement breach detected during deployment")
+        print("   - System entered FAILURE_DETECTED state")
+        print("   - Manual intervention required")
     print()
-    print("DEPLOYMENT FAILED")
-    print("   - Requirement breach detected during deployment")
-    print("   - System entered FAILURE_DETECTED state")
-    print("   - Manual intervention required")
-print()
\ No newline at end of file
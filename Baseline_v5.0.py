@@ -19,22 +19,28 @@ v5.0 adds automated test cases to verify:
 - State machine integrity
 """
 
-from enum import Enum, auto
-from dataclasses import dataclass
-import time
-
-# COMMERCIAL TOOL: matplotlib for visualization
-try:
-    import matplotlib.pyplot as plt
-    VISUALIZATION_AVAILABLE = True
-except ImportError:
-    VISUALIZATION_AVAILABLE = False
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from dataclasses import dataclass, field
+from functools import cache
+import asyncio
+import logging
+import os
+import sys
+import threading
+
+# Report section rule
+_HRULE = "=" * 70
+
+logger = logging.getLogger("landing_gear")
+logger.addHandler(logging.NullHandler())
 
 # ============================================================
 # LEGACY COMPONENT: Configuration from simulation baseline
 # ============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GearConfiguration:
     """Legacy configuration from approved simulation"""
     pump_latency_ms: int
@@ -43,6 +49,21 @@ class GearConfiguration:
     lock_time_ms: int
     requirement_time_ms: int = 8000
 
+    # Derived timing, fixed once the configuration is built
+    extension_time_ms: int = field(init=False)
+    total_nominal_ms: int = field(init=False)
+
+    def __post_init__(self):
+        extension_time_ms = int(
+            self.extension_distance_mm * 100.0 / self.actuator_speed_mm_per_100ms
+        )
+        object.__setattr__(self, "extension_time_ms", extension_time_ms)
+        object.__setattr__(
+            self,
+            "total_nominal_ms",
+            self.pump_latency_ms + extension_time_ms + self.lock_time_ms,
+        )
+
 
 # Standard baseline configuration
 BASELINE_CONFIG = GearConfiguration(
@@ -62,137 +83,485 @@ SLOW_CONFIG = GearConfiguration(
     requirement_time_ms=8000
 )
 
+# Tight configuration (300ms nominal, 350ms limit) - passes pre-flight,
+# so only an in-flight overrun can breach it
+TIGHT_CONFIG = GearConfiguration(
+    pump_latency_ms=100,
+    actuator_speed_mm_per_100ms=100.0,
+    extension_distance_mm=100,
+    lock_time_ms=100,
+    requirement_time_ms=350
+)
+
+# Zero-margin configuration (300ms nominal, 300ms limit) for the
+# rounding boundary test
+ZERO_MARGIN_CONFIG = GearConfiguration(
+    pump_latency_ms=100,
+    actuator_speed_mm_per_100ms=100.0,
+    extension_distance_mm=100,
+    lock_time_ms=100,
+    requirement_time_ms=300
+)
+
+# Long configuration (10s nominal, 12s limit) for the abort test - the
+# abort ends it early, and a slow runner cannot finish it first
+ABORT_TEST_CONFIG = GearConfiguration(
+    pump_latency_ms=2000,
+    actuator_speed_mm_per_100ms=1.0,
+    extension_distance_mm=70,
+    lock_time_ms=1000,
+    requirement_time_ms=12000
+)
+
+# Requirement watchdog polling period during deployment
+MONITOR_TICK_MS = 50
+
 # ============================================================
 # STATE MODEL
 # ============================================================
 
-class GearState(Enum):
-    UP_LOCKED = auto()
-    TRANSITIONING_DOWN = auto()
-    DOWN_LOCKED = auto()
-    TRANSITIONING_UP = auto()
-    FAILURE_DETECTED = auto()
+class GearState(IntEnum):
+    UP_LOCKED = 0
+    TRANSITIONING_DOWN = 1
+    DOWN_LOCKED = 2
+    TRANSITIONING_UP = 3
+    FAILURE_DETECTED = 4
+
+# Members pre-bound at module level so hot paths skip the class lookup
+UP_LOCKED, TRANSITIONING_DOWN, DOWN_LOCKED, TRANSITIONING_UP, FAILURE_DETECTED = GearState
+
+_STATE_NAMES = tuple(state.name for state in GearState)
+
+# Log line prefix per state, built once
+_STATE_PREFIX = tuple(f"[{name}] " for name in _STATE_NAMES)
+
+# State transition table: (state, event) -> next state.
+# FAILURE_DETECTED is entered directly on a requirement breach.
+_TRANSITIONS = {
+    (UP_LOCKED, "DOWN"): TRANSITIONING_DOWN,
+    (TRANSITIONING_DOWN, "LOCKED"): DOWN_LOCKED,
+    (DOWN_LOCKED, "UP"): TRANSITIONING_UP,
+    (TRANSITIONING_UP, "LOCKED"): UP_LOCKED,
+}
+
+# Reasons logged for a command with no legal transition; (None, command)
+# is the fallback when the current state has no specific reason
+_REJECTIONS = {
+    (DOWN_LOCKED, "DOWN"): "gear already down",
+    (None, "DOWN"): "invalid state for deployment",
+    (None, "UP"): "invalid state for retraction",
+}
+
+# ============================================================
+# NUMERIC KERNELS
+# ============================================================
+
+_PHASE_NAMES = ("pump", "extension", "lock")
+
+
+def _simulate_deploy(pump_ms, extension_ms, lock_ms, requirement_ms):
+    """
+    Nominal deployment over the three phase durations. Kept as plain
+    Python: _preflight_verdict runs it once per configuration, too rarely
+    to repay a JIT's import and compile time.
+    Returns (elapsed_ms, fault, breach_phase): elapsed time at the end of the
+    last phase run, whether the requirement was exceeded, and the index
+    into _PHASE_NAMES of the phase that exceeded it (-1 if none did).
+    """
+    elapsed = pump_ms
+    if elapsed > requirement_ms:
+        return elapsed, True, 0
+    elapsed += extension_ms
+    if elapsed > requirement_ms:
+        return elapsed, True, 1
+    elapsed += lock_ms
+    if elapsed > requirement_ms:
+        return elapsed, True, 2
+    return elapsed, False, -1
+
+# ============================================================
+# PHASE PLAN
+# ============================================================
+
+@cache
+def _phase_plan(config: GearConfiguration):
+    """
+    Deadline, log message and timeline event for each deployment phase.
+    Configurations are frozen and hashable, so every controller built
+    from the same configuration shares one plan.
+    """
+    pump_time = config.pump_latency_ms
+    extension_time = config.extension_time_ms
+    lock_time = config.lock_time_ms
+    return (
+        (pump_time,
+         f"Hydraulic pump activating ({pump_time}ms)",
+         f"Pump ready ({pump_time}ms)"),
+        (pump_time + extension_time,
+         f"Actuator extending ({extension_time}ms)",
+         f"Extension complete ({extension_time}ms)"),
+        (config.total_nominal_ms,
+         f"Engaging down-lock ({lock_time}ms)",
+         f"Lock engaged ({lock_time}ms)"),
+    )
+
+
+@cache
+def _preflight_verdict(config: GearConfiguration):
+    """
+    Nominal (elapsed_ms, fault, breach_phase) for a configuration.
+    It depends only on the frozen fields, so it is evaluated once per
+    configuration rather than once per controller or deployment.
+    """
+    return _simulate_deploy(
+        config.pump_latency_ms, config.extension_time_ms,
+        config.lock_time_ms, config.requirement_time_ms
+    )
+
+# ============================================================
+# CLOCKS
+# ============================================================
+
+class RealClock:
+    """Wall-clock time from the running event loop's monotonic clock"""
+    realtime = True
+
+    def now_ms(self):
+        return asyncio.get_running_loop().time() * 1000
+
+    async def sleep_until_ms(self, deadline_ms):
+        await asyncio.sleep(max(0.0, (deadline_ms - self.now_ms()) / 1000))
+
+
+class VirtualClock:
+    """Simulated time for validation runs - sleeping jumps straight to the deadline"""
+    realtime = False
+
+    def __init__(self):
+        self._now_ms = 0
+
+    def now_ms(self):
+        return self._now_ms
+
+    async def sleep_until_ms(self, deadline_ms):
+        self._now_ms = max(self._now_ms, deadline_ms)
 
 # ============================================================
 # LANDING GEAR CONTROLLER
 # ============================================================
 
+@dataclass(slots=True)
+class TimelineEntry:
+    """One audit trail event, rebuilt from the controller's timeline columns"""
+    time_ms: int
+    state: GearState
+    event: str
+
+
 class LandingGearController:
-    def __init__(self, config: GearConfiguration):
-        self.state = GearState.UP_LOCKED
+    __slots__ = (
+        "_abort_target", "_log_buf", "_preflight", "_run_phases",
+        "_state_prefix", "clock", "config", "deployment_time_ms",
+        "fault_detected", "quiet", "state",
+        "timeline_event", "timeline_state", "timeline_time",
+    )
+
+    def __init__(self, config: GearConfiguration, quiet: bool = False,
+                 clock=None):
+        self._set_state(UP_LOCKED)
         self.config = config
+        self.quiet = quiet  # skip controller log lines entirely
+        self.clock = clock or RealClock()
+        self._log_buf = []
         self.deployment_time_ms = 0
         self.fault_detected = False
-        self.timeline = []
-
-    def log(self, message):
-        print(f"[{self.state.name}] {message}")
+        self._reset_timeline()
+        self._abort_target = None  # (loop, event) while a real-time deployment runs
+        self._run_phases = self._make_run_phases(_phase_plan(config))
+        self._preflight = _preflight_verdict(config)
+
+    def _set_state(self, state):
+        """Single point for state changes; keeps the log prefix in step"""
+        self.state = state
+        self._state_prefix = _STATE_PREFIX[state]
+
+    def log(self, message, *args, level=logging.INFO):
+        """Buffer a log line; %-style args are only formatted if it is emitted"""
+        if self.quiet or not logger.isEnabledFor(level):
+            return
+        self._log_buf.append((level, self._state_prefix, message, args))
+
+    def _flush_log(self):
+        """Emit buffered log lines, one record per line at its own level"""
+        buf = self._log_buf
+        for level, prefix, message, args in buf:
+            logger.log(level, prefix + message, *args)
+        buf.clear()
+
+    def _reset_timeline(self):
+        """
+        Timeline is stored column-wise: times, state codes and event labels.
+        The columns are public for bulk analysis - timeline_time supports the
+        buffer protocol, so e.g. numpy.asarray() can wrap it without copying.
+        """
+        self.timeline_time = array("i")
+        self.timeline_state = bytearray()
+        self.timeline_event = []
+
+    @property
+    def timeline(self):
+        """Audit trail as TimelineEntry records, built on demand"""
+        return [
+            TimelineEntry(time_ms, GearState(state), event)
+            for time_ms, state, event in zip(
+                self.timeline_time, self.timeline_state, self.timeline_event
+            )
+        ]
 
     def _record_event(self, event: str):
         """Record timeline for audit trail"""
-        self.timeline.append({
-            "time_ms": self.deployment_time_ms,
-            "state": self.state.name,
-            "event": event
-        })
+        self.timeline_time.append(self.deployment_time_ms)
+        self.timeline_state.append(self.state)
+        self.timeline_event.append(event)
 
     def _check_requirement(self):
         """Real-time requirement monitoring"""
-        if self.deployment_time_ms > self.config.requirement_time_ms:
-            self.log(
-                f"REQUIREMENT BREACH: "
-                f"{self.deployment_time_ms}ms > {self.config.requirement_time_ms}ms"
-            )
-            self.state = GearState.FAILURE_DETECTED
+        dep = self.deployment_time_ms
+        req = self.config.requirement_time_ms
+        if dep > req:
+            self.log("REQUIREMENT BREACH: %dms > %dms", dep, req, level=logging.WARNING)
+            self._set_state(FAILURE_DETECTED)
             self.fault_detected = True
             self._record_event("Requirement breach detected")
             return False
 
-        margin = self.config.requirement_time_ms - self.deployment_time_ms
         self.log(
-            f"✓ Requirement check PASSED "
-            f"({self.deployment_time_ms}ms / {self.config.requirement_time_ms}ms, "
-            f"margin: {margin}ms)"
+            "✓ Requirement check PASSED (%dms / %dms, margin: %dms)",
+            dep, req, req - dep
         )
         return True
 
-    def command_gear_down(self):
-        """Deploy landing gear with full monitoring"""
-        if self.state == GearState.DOWN_LOCKED:
-            self.log("Command rejected - gear already down")
+    def _elapsed_ms(self, started):
+        """
+        Whole ms since started, truncated; phase boundaries and the watchdog
+        share this one rule. A real sleep always wakes slightly late, so
+        truncation lets a zero-margin configuration pass as it does at
+        pre-flight and on virtual time - only a full 1ms overrun breaches.
+        """
+        return int(self.clock.now_ms() - started)
+
+    async def _wait_until(self, started, deadline_ms):
+        """Sleep until deadline_ms after started, return actual elapsed ms"""
+        await self.clock.sleep_until_ms(started + deadline_ms)
+        return self._elapsed_ms(started)
+
+    async def _watch_requirement(self, started):
+        """
+        Background watchdog - returns the elapsed ms once the requirement is
+        exceeded mid-phase rather than at the next phase boundary.
+        It only reports; _gear_down records the breach after the phases are
+        cancelled, so a single task decides the outcome.
+        """
+        limit_ms = self.config.requirement_time_ms
+        while (elapsed_ms := self._elapsed_ms(started)) <= limit_ms:
+            await asyncio.sleep(MONITOR_TICK_MS / 1000)
+        return elapsed_ms
+
+    def _make_run_phases(self, plan):
+        """
+        Build the pump, extension and lock sequence for this controller.
+        The configuration is frozen, so phase deadlines and log text from
+        its plan are captured by the returned coroutine.
+        Each phase sleeps to an absolute deadline measured from started, so
+        scheduler jitter does not accumulate and deployment_time_ms is the
+        actual elapsed time rather than the nominal sum.
+        """
+        requirement = self.config.requirement_time_ms
+
+        async def run_phases(started):
+            # Pump, extension, lock - each checked against the requirement
+            for deadline_ms, message, event in plan:
+                self.log(message)
+                self.deployment_time_ms = await self._wait_until(started, deadline_ms)
+                self._record_event(event)
+
+                if not self._check_requirement():
+                    return False
+
+            # Success
+            self._set_state(_TRANSITIONS[(self.state, "LOCKED")])
+            margin = requirement - self.deployment_time_ms
+            self.log(
+                "Deployment SUCCESSFUL - Total: %dms (Margin: %dms)",
+                self.deployment_time_ms, margin
+            )
+            self._record_event("Deployment complete - SUCCESS")
+            return True
+
+        return run_phases
+
+    def _transition(self, command):
+        """Apply a pilot command through the transition table, or log why it is rejected"""
+        next_state = _TRANSITIONS.get((self.state, command))
+        if next_state is None:
+            reason = (_REJECTIONS.get((self.state, command))
+                      or _REJECTIONS[(None, command)])
+            self.log("Command rejected - %s", reason)
             return False
 
-        if self.state != GearState.UP_LOCKED:
-            self.log("Command rejected - invalid state for deployment")
+        self.log("Command received: GEAR %s", command)
+        self._set_state(next_state)
+        return True
+
+    async def command_gear_down(self):
+        """Deploy landing gear with full monitoring"""
+        try:
+            return await self._gear_down()
+        finally:
+            self._flush_log()
+
+    async def _gear_down(self):
+        if not self._transition("DOWN"):
             return False
 
-        self.log("Command received: GEAR DOWN")
         self.deployment_time_ms = 0
         self.fault_detected = False
-        self.timeline = []
+        self._reset_timeline()
         self._record_event("Deployment command issued")
 
-        # Phase 1: Hydraulic pump
-        self.state = GearState.TRANSITIONING_DOWN
-        pump_time = self.config.pump_latency_ms
-        self.log(f"Hydraulic pump activating ({pump_time}ms)")
-        time.sleep(pump_time / 1000)
-        self.deployment_time_ms += pump_time
-        self._record_event(f"Pump ready ({pump_time}ms)")
-
-        if not self._check_requirement():
-            return False
-
-        # Phase 2: Actuator extension
-        speed = self.config.actuator_speed_mm_per_100ms / 100.0
-        extension_time = int(self.config.extension_distance_mm / speed)
-        self.log(f"Actuator extending ({extension_time}ms)")
-        time.sleep(extension_time / 1000)
-        self.deployment_time_ms += extension_time
-        self._record_event(f"Extension complete ({extension_time}ms)")
-
-        if not self._check_requirement():
-            return False
-
-        # Phase 3: Lock engagement
-        lock_time = self.config.lock_time_ms
-        self.log(f"Engaging down-lock ({lock_time}ms)")
-        time.sleep(lock_time / 1000)
-        self.deployment_time_ms += lock_time
-        self._record_event(f"Lock engaged ({lock_time}ms)")
-
-        if not self._check_requirement():
+        # Pre-flight: the nominal budget is known before anything moves
+        nominal_ms, fault, phase = self._preflight
+        if fault:
+            self.log(
+                "PRE-FLIGHT BREACH: nominal %dms > %dms after %s phase",
+                nominal_ms, self.config.requirement_time_ms, _PHASE_NAMES[phase],
+                level=logging.WARNING
+            )
+            self._set_state(FAILURE_DETECTED)
+            self.fault_detected = True
+            self._record_event("Pre-flight requirement breach")
             return False
 
-        # Success
-        self.state = GearState.DOWN_LOCKED
-        margin = self.config.requirement_time_ms - self.deployment_time_ms
+        started = self.clock.now_ms()
+        try:
+            return await self._deploy(started)
+        except asyncio.CancelledError:
+            # A cancelled caller must not leave the gear stuck in TRANSITIONING_DOWN
+            self.deployment_time_ms = self._elapsed_ms(started)
+            self.log(
+                "Deployment CANCELLED at %dms", self.deployment_time_ms,
+                level=logging.WARNING
+            )
+            self._set_state(FAILURE_DETECTED)
+            self.fault_detected = True
+            self._record_event("Deployment cancelled")
+            raise
+
+    async def _deploy(self, started):
+        """Run the phases; on the real clock they race the watchdog and abort"""
+        if not self.clock.realtime:
+            # Virtual time never runs over mid-phase - boundary checks suffice
+            return await self._run_phases(started)
+
+        # Phases, watchdog and abort signal race; whichever finishes first wins
+        abort_event = asyncio.Event()
+        self._abort_target = (asyncio.get_running_loop(), abort_event)
+        phases = asyncio.create_task(self._run_phases(started))
+        watchdog = asyncio.create_task(self._watch_requirement(started))
+        aborted = asyncio.create_task(abort_event.wait())
+        tasks = (phases, watchdog, aborted)
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            # The losers must be fully stopped before the outcome is recorded
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._abort_target = None
+
+        # Finished phases already ran every boundary check - their verdict stands
+        if phases in done:
+            return phases.result()
+
+        if watchdog in done:
+            self.deployment_time_ms = watchdog.result()
+            return self._check_requirement()
+
+        self.deployment_time_ms = self._elapsed_ms(started)
         self.log(
-            f"Deployment SUCCESSFUL - Total: "
-            f"{self.deployment_time_ms}ms (Margin: {margin}ms)"
+            "Deployment ABORTED at %dms - fault signal received",
+            self.deployment_time_ms, level=logging.WARNING
         )
-        self._record_event("Deployment complete - SUCCESS")
-        return True
-
-    def command_gear_up(self):
+        self._set_state(FAILURE_DETECTED)
+        self.fault_detected = True
+        self._record_event("Deployment aborted")
+        return False
+
+    def abort(self):
+        """
+        Interrupt a running deployment, e.g. from a fault monitor thread.
+        Safe to call from any thread; does nothing if no deployment is running.
+        The loop and event are published as one tuple, so a single read
+        sees either both or neither.
+        """
+        target = self._abort_target
+        if target is not None:
+            loop, event = target
+            loop.call_soon_threadsafe(event.set)
+
+    async def command_gear_up(self):
         """Retract landing gear"""
-        if self.state != GearState.DOWN_LOCKED:
-            self.log("Command rejected - invalid state for retraction")
+        try:
+            return self._gear_up()
+        finally:
+            self._flush_log()
+
+    def _gear_up(self):
+        if not self._transition("UP"):
             return False
 
-        self.log("Command received: GEAR UP")
-        self.state = GearState.TRANSITIONING_UP
         self.log("Gear retracting")
-        self.state = GearState.UP_LOCKED
+        self._set_state(_TRANSITIONS[(self.state, "LOCKED")])
         self.log("Gear locked UP")
         return True
 
+# ============================================================
+# CONFIGURATION SWEEPS
+# ============================================================
+
+def _simulate(config: GearConfiguration):
+    """Sweep worker: one virtual-time deployment, returns (time_ms, fault)"""
+    controller = LandingGearController(config, quiet=True, clock=VirtualClock())
+    asyncio.run(controller.command_gear_down())
+    return controller.deployment_time_ms, controller.fault_detected
+
+
+def run_config_sweep(configs, max_workers=None):
+    """
+    Deploy every configuration on virtual time across worker processes.
+    Returns (deployment_time_ms, fault_detected) per configuration, in order.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_simulate, configs))
+
 # ============================================================
 # NEW in v5.0: AUTOMATED TEST SUITE
 # ============================================================
 
+@dataclass(slots=True, frozen=True)
+class TestRecord:
+    """Outcome of one automated test"""
+    name: str
+    status: str
+    passed: bool
+    details: str
+
+
 class TestResults:
-    def __init__(self):
+    __slots__ = ("quiet", "results", "tests_failed", "tests_passed", "tests_run")
+
+    def __init__(self, quiet=False):
+        self.quiet = quiet  # CI mode: no per-test lines, summary only
         self.tests_run = 0
         self.tests_passed = 0
         self.tests_failed = 0
@@ -207,84 +576,208 @@ class TestResults:
             self.tests_failed += 1
             status = "FAIL"
 
-        self.results.append({
-            "name": name,
-            "status": status,
-            "passed": passed,
-            "details": details
-        })
+        self.results.append(TestRecord(name, status, passed, details))
+        if self.quiet:
+            return
 
-        print(f"{status}: {name}")
+        line = f"{status}: {name}\n"
         if details:
-            print(f"         {details}")
+            line += f"         {details}\n"
+        sys.stdout.write(line)
 
     def print_summary(self):
-        print("\n" + "=" * 70)
-        print("TEST SUMMARY")
-        print("=" * 70)
-        print(f"Tests Run: {self.tests_run}")
-        print(f"Passed: {self.tests_passed}")
-        print(f"Failed: {self.tests_failed}")
-        print(f"Pass Rate: {(self.tests_passed / self.tests_run * 100):.1f}%\n")
+        sys.stdout.write("\n".join((
+            "\n" + _HRULE,
+            "TEST SUMMARY",
+            _HRULE,
+            f"Tests Run: {self.tests_run}",
+            f"Passed: {self.tests_passed}",
+            f"Failed: {self.tests_failed}",
+            f"Pass Rate: {(self.tests_passed / self.tests_run * 100):.1f}%\n\n",
+        )))
+        if self.quiet and self.tests_failed:
+            sys.stdout.write("".join(
+                f"FAIL: {record.name}\n" for record in self.results if not record.passed
+            ))
 
 # ============================================================
 # TEST EXECUTION
 # ============================================================
 
-def run_automated_tests():
-    """Automated test suite for systematic verification"""
-
-    print("=" * 70)
-    print("BAE Systems Landing Gear - Baseline v5.0")
-    print("AUTOMATED TEST SUITE")
-    print("=" * 70 + "\n")
-
-    results = TestResults()
+async def _test_shared_controller(results):
+    """Tests 1-4 drive one controller through a full cycle, so run in order"""
 
     # Test 1: Nominal deployment
-    controller = LandingGearController(BASELINE_CONFIG)
-    success = controller.command_gear_down()
+    controller = LandingGearController(BASELINE_CONFIG, clock=VirtualClock())
+    success = await controller.command_gear_down()
     results.record_test(
         "Nominal deployment within requirement",
-        success and controller.state == GearState.DOWN_LOCKED,
+        success and controller.state == DOWN_LOCKED,
         f"Time: {controller.deployment_time_ms}ms"
     )
 
     # Test 2: Already deployed
-    success2 = controller.command_gear_down()
+    success2 = await controller.command_gear_down()
     results.record_test(
         "Reject deployment when already deployed",
-        not success2 and controller.state == GearState.DOWN_LOCKED
+        not success2 and controller.state == DOWN_LOCKED
     )
 
     # Test 3: Retraction
-    success3 = controller.command_gear_up()
+    success3 = await controller.command_gear_up()
     results.record_test(
         "Gear retraction functionality",
-        success3 and controller.state == GearState.UP_LOCKED
+        success3 and controller.state == UP_LOCKED
     )
 
     # Test 4: Invalid retraction
-    success4 = controller.command_gear_up()
+    success4 = await controller.command_gear_up()
     results.record_test(
         "Reject retraction when already retracted",
         not success4
     )
+    return controller
+
 
-    # Test 5: Timing violation
-    slow_controller = LandingGearController(SLOW_CONFIG)
-    success5 = slow_controller.command_gear_down()
+async def _test_timing_breach(results):
+    # Test 5: Timing violation - SLOW_CONFIG is caught at pre-flight
+    slow_controller = LandingGearController(SLOW_CONFIG, clock=VirtualClock())
+    success5 = await slow_controller.command_gear_down()
     results.record_test(
         "Detect timing requirement breach",
         not success5 and slow_controller.fault_detected
     )
 
-    # Test 6: Timeline tracking
-    test_controller = LandingGearController(BASELINE_CONFIG)
-    test_controller.command_gear_down()
+
+async def _test_abort(results):
+    # Test 6: Abort from another thread on the real clock, watchdog running
+    abort_controller = LandingGearController(ABORT_TEST_CONFIG)
+    timer = threading.Timer(0.1, abort_controller.abort)
+    timer.start()
+    try:
+        success6 = await abort_controller.command_gear_down()
+    finally:
+        timer.cancel()
+    results.record_test(
+        "Abort interrupts a real-time deployment",
+        not success6
+        and abort_controller.state == FAILURE_DETECTED
+        and "Deployment aborted" in abort_controller.timeline_event,
+        f"Time: {abort_controller.deployment_time_ms}ms"
+    )
+
+
+class _OversleepClock(RealClock):
+    """Real clock whose sleeps overrun by a fixed amount, like a stalled actuator"""
+
+    def __init__(self, oversleep_ms):
+        self.oversleep_ms = oversleep_ms
+
+    async def sleep_until_ms(self, deadline_ms):
+        await super().sleep_until_ms(deadline_ms + self.oversleep_ms)
+
+
+class _LateVirtualClock(VirtualClock):
+    """Virtual clock that wakes a fraction of a ms late, like a real sleep"""
+
+    def __init__(self, late_ms):
+        super().__init__()
+        self.late_ms = late_ms
+
+    async def sleep_until_ms(self, deadline_ms):
+        await super().sleep_until_ms(deadline_ms + self.late_ms)
+
+
+async def _test_inflight_breach(results):
+    # Test 7: Overrun mid-phase on the real clock - the watchdog must
+    # flag it long before the stalled pump phase wakes up
+    stalled_controller = LandingGearController(
+        TIGHT_CONFIG, clock=_OversleepClock(1000)
+    )
+    success7 = await stalled_controller.command_gear_down()
+    results.record_test(
+        "Detect requirement breach during deployment",
+        not success7
+        and stalled_controller.state == FAILURE_DETECTED
+        and stalled_controller.timeline_event.count("Requirement breach detected") == 1,
+        f"Time: {stalled_controller.deployment_time_ms}ms"
+    )
+
+
+async def run_automated_tests():
+    """Automated test suite for systematic verification"""
+
+    sys.stdout.write("\n".join((
+        _HRULE,
+        "BAE Systems Landing Gear - Baseline v5.0",
+        "AUTOMATED TEST SUITE",
+        _HRULE + "\n\n",
+    )))
+
+    results = TestResults(quiet=os.environ.get("CI") in ("1", "true"))
+
+    # Nominal controller chatter is INFO; breaches and aborts stay visible
+    previous_level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        # Independent controllers run concurrently, so a real-time run
+        # takes as long as the slowest group rather than the sum of all
+        controller, *_ = await asyncio.gather(
+            _test_shared_controller(results),
+            _test_timing_breach(results),
+            _test_abort(results),
+            _test_inflight_breach(results),
+        )
+    finally:
+        logger.setLevel(previous_level)
+
+    # Test 8: Timeline tracking - Test 1's deployment trail is still
+    # intact, as rejected commands and retraction leave it untouched
     results.record_test(
         "Timeline tracking completeness",
-        len(test_controller.timeline) > 0
+        len(controller.timeline_time) > 0
+    )
+
+    # Test 9: Configuration sweep around the baseline
+    sweep = [
+        GearConfiguration(
+            pump_latency_ms=pump_ms,
+            actuator_speed_mm_per_100ms=speed,
+            extension_distance_mm=700,
+            lock_time_ms=300,
+        )
+        for pump_ms in (200, 500, 1000)
+        for speed in (5.0, 7.5, 10.0, 12.5, 15.0)
+    ]
+    # The pool blocks until every worker is done, so keep it off the loop;
+    # two workers are plenty for deployments that take microseconds
+    outcomes = await asyncio.to_thread(run_config_sweep, sweep, max_workers=2)
+
+    # Hand-computed: totals above 8000ms are 200/500ms pump at 5.0 and
+    # 7.5 mm/100ms, plus 1000ms pump up to 10.0 - seven in all; the
+    # baseline point (200ms pump, 10.0 mm/100ms) is the 7500ms nominal
+    results.record_test(
+        "Configuration sweep matches hand-computed outcomes",
+        sum(fault for _, fault in outcomes) == 7
+        and outcomes[sweep.index(BASELINE_CONFIG)] == (7500, False),
+        f"{len(sweep)} configurations, "
+        f"{sum(fault for _, fault in outcomes)} over budget"
+    )
+
+    # Test 10: Rounding boundary - sub-ms wake-up lag on a zero-margin
+    # configuration is within the requirement, a full ms over is not
+    on_time = LandingGearController(
+        ZERO_MARGIN_CONFIG, quiet=True, clock=_LateVirtualClock(0.6)
+    )
+    over_time = LandingGearController(
+        ZERO_MARGIN_CONFIG, quiet=True, clock=_LateVirtualClock(1.0)
+    )
+    results.record_test(
+        "Zero-margin deployment breaches only on a whole-ms overrun",
+        await on_time.command_gear_down()
+        and not await over_time.command_gear_down()
+        and over_time.fault_detected,
+        f"Times: {on_time.deployment_time_ms}ms / {over_time.deployment_time_ms}ms"
     )
 
     results.print_summary()
@@ -292,4 +785,5 @@ def run_automated_tests():
 
 
 if __name__ == "__main__":
-    test_results = run_automated_tests()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    test_results = asyncio.run(run_automated_tests())